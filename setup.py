@@ -44,7 +44,13 @@ setup(
     py_modules=['miniflux'],
     python_requires='>=3.6',
     zip_safe=True,
-    test_suite='tests',
+    extras_require={
+        'test': [
+            'pytest',
+            'pytest-xdist',
+            'requests-mock',
+        ],
+    },
     classifiers=[
         'Intended Audience :: Developers',
         'Natural Language :: English',
@@ -20,10 +20,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+
 import json
-import time
-import unittest
-from unittest import mock
+from base64 import b64encode
+from types import SimpleNamespace
+
+import pytest
 
 import miniflux
 from miniflux import ClientError
@@ -31,714 +33,405 @@ from miniflux import ClientError
 from requests.exceptions import Timeout
 
 
-class TestMinifluxClient(unittest.TestCase):
-
-    def test_get_error_reason(self):
-        response = mock.Mock()
-        response.status_code = 404
-        response.json.return_value = {'error_message': 'some error'}
-        error = ClientError(response)
-        self.assertEqual(error.status_code, 404)
-        self.assertEqual(error.get_error_reason(), 'some error')
-
-    def test_get_error_without_reason(self):
-        response = mock.Mock()
-        response.status_code = 404
-        response.json.return_value = {}
-        error = ClientError(response)
-        self.assertEqual(error.status_code, 404)
-        self.assertEqual(error.get_error_reason(), 'status_code=404')
-
-    def test_get_error_with_bad_response(self):
-        response = mock.Mock()
-        response.status_code = 404
-        response.json.return_value = None
-        error = ClientError(response)
-        self.assertEqual(error.status_code, 404)
-        self.assertEqual(error.get_error_reason(), 'status_code=404')
-
-    def test_base_url_with_trailing_slash(self):
-        requests = _get_request_mock()
-        expected_result = [{"url": "http://example.org/feed", "title": "Example", "type": "RSS"}]
-
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = expected_result
-
-        requests.post.return_value = response
-
-        client = miniflux.Client("http://localhost/", "username", "password")
-        result = client.discover("http://example.org/")
-
-        requests.post.assert_called_once_with('http://localhost/v1/discover',
-                                              headers=None,
-                                              auth=('username', 'password'),
-                                              data=mock.ANY,
-                                              timeout=30)
-
-        self.assertEqual(result, expected_result)
-
-    def test_get_me(self):
-        requests = _get_request_mock()
-        expected_result = {"id": 123, "username": "foobar"}
-
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = expected_result
-
-        requests.get.return_value = response
-
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.me()
-
-        requests.get.assert_called_once_with('http://localhost/v1/me',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             timeout=30)
-
-        self.assertEqual(result, expected_result)
+BASE = "http://localhost"
+URLS = {
+    'discover': f"{BASE}/v1/discover",
+    'me': f"{BASE}/v1/me",
+    'export': f"{BASE}/v1/export",
+    'import': f"{BASE}/v1/import",
+    'feeds': f"{BASE}/v1/feeds",
+    'feeds_refresh': f"{BASE}/v1/feeds/refresh",
+    'feed_123': f"{BASE}/v1/feeds/123",
+    'feed_123_refresh': f"{BASE}/v1/feeds/123/refresh",
+    'feed_123_entries': f"{BASE}/v1/feeds/123/entries",
+    'feed_123_mark_all_as_read': f"{BASE}/v1/feeds/123/mark-all-as-read",
+    'category_123_mark_all_as_read': f"{BASE}/v1/categories/123/mark-all-as-read",
+    'entries': f"{BASE}/v1/entries",
+    'entry_123': f"{BASE}/v1/entries/123",
+    'user_123': f"{BASE}/v1/users/123",
+    'user_foobar': f"{BASE}/v1/users/foobar",
+    'user_123_mark_all_as_read': f"{BASE}/v1/users/123/mark-all-as-read",
+}
+AUTH = ("username", "password")
+BASIC_AUTH_HEADERS = {
+    "Authorization": "Basic " + b64encode(":".join(AUTH).encode()).decode(),
+    "X-Auth-Token": None,
+}
+TOKEN_HEADERS = {"X-Auth-Token": "secret", "Authorization": None}
+BEFORE_TS = 1_600_000_000
+BASE_FEED_PAYLOAD = {"feed_url": "http://example.org/feed", "category_id": 123}
 
-    def test_get_me_with_server_error(self):
-        requests = _get_request_mock()
 
-        response = mock.Mock()
-        response.status_code = 500
+@pytest.fixture(scope='module')
+def basic_client():
+    return miniflux.Client(BASE, *AUTH)
 
-        requests.get.return_value = response
 
-        client = miniflux.Client("http://localhost", "username", "password")
+@pytest.fixture(scope='module')
+def api_key_client():
+    return miniflux.Client(BASE, api_key="secret")
 
-        with self.assertRaises(ClientError):
-            client.me()
 
-    def test_discover(self):
-        requests = _get_request_mock()
-        expected_result = [{"url": "http://example.org/feed", "title": "Example", "type": "RSS"}]
+def _assert_request(rmock, method, url, headers=BASIC_AUTH_HEADERS, timeout=30):
+    assert rmock.call_count == 1
+    request = rmock.last_request
+    actual_headers = {name: request.headers.get(name) for name in headers}
+    assert (request.method, request.url, actual_headers, request.timeout) == (method, url, headers, timeout)
+    return request
 
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = expected_result
 
-        requests.post.return_value = response
+def _resp(status_code, json_value=None, text=None):
+    response = SimpleNamespace(status_code=status_code, text=text)
+    response.json = lambda: json_value
+    return response
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.discover("http://example.org/")
 
-        requests.post.assert_called_once_with('http://localhost/v1/discover',
-                                              headers=None,
-                                              auth=('username', 'password'),
-                                              data=mock.ANY,
-                                              timeout=30)
+@pytest.mark.parametrize('json_value,expected_reason', [
+    ({'error_message': 'some error'}, 'some error'),
+    ({}, 'status_code=404'),
+    (None, 'status_code=404'),
+])
+def test_get_error_reason(json_value, expected_reason):
+    error = ClientError(_resp(404, json_value))
+    assert (error.status_code, error.get_error_reason()) == (404, expected_reason)
 
-        _, kwargs = requests.post.call_args
-        payload = json.loads(kwargs.get('data'))
 
-        self.assertEqual(payload.get('url'), "http://example.org/")
-        self.assertIsNone(payload.get('username'))
-        self.assertIsNone(payload.get('password'))
-        self.assertEqual(result, expected_result)
+def test_base_url_with_trailing_slash(rmock):
+    expected_result = [{"url": "http://example.org/feed", "title": "Example", "type": "RSS"}]
 
-    def test_discover_with_credentials(self):
-        requests = _get_request_mock()
-        expected_result = [{"url": "http://example.org/feed", "title": "Example", "type": "RSS"}]
+    rmock.post(URLS['discover'], json=expected_result)
 
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = expected_result
+    client = miniflux.Client(BASE + "/", *AUTH)
+    result = client.discover("http://example.org/")
 
-        requests.post.return_value = response
+    _assert_request(rmock, 'POST', URLS['discover'])
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.discover("http://example.org/", username="foobar", password="secret", user_agent="Bot")
+    assert result == expected_result
 
-        requests.post.assert_called_once_with('http://localhost/v1/discover',
-                                              headers=None,
-                                              auth=('username', 'password'),
-                                              data=mock.ANY,
-                                              timeout=30)
 
-        _, kwargs = requests.post.call_args
-        payload = json.loads(kwargs.get('data'))
+def test_get_me(rmock, basic_client):
+    expected_result = {"id": 123, "username": "foobar"}
 
-        self.assertEqual(payload.get('url'), "http://example.org/")
-        self.assertEqual(payload.get('username'), "foobar")
-        self.assertEqual(payload.get('password'), "secret")
-        self.assertEqual(payload.get('user_agent'), "Bot")
-        self.assertEqual(result, expected_result)
+    rmock.get(URLS['me'], json=expected_result)
 
-    def test_discover_with_server_error(self):
-        requests = _get_request_mock()
-        expected_result = {'error_message': 'some error'}
+    result = basic_client.me()
 
-        response = mock.Mock()
-        response.status_code = 500
-        response.json.return_value = expected_result
+    _assert_request(rmock, 'GET', URLS['me'])
 
-        requests.post.return_value = response
+    assert result == expected_result
 
-        client = miniflux.Client("http://localhost", "username", "password")
 
-        with self.assertRaises(ClientError):
-            client.discover("http://example.org/")
+def test_get_me_with_server_error(rmock, basic_client):
+    rmock.get(URLS['me'], status_code=500)
 
-    def test_export(self):
-        requests = _get_request_mock()
-        expected_result = "OPML feed"
+    with pytest.raises(ClientError):
+        basic_client.me()
 
-        response = mock.Mock()
-        response.status_code = 200
-        response.text = expected_result
 
-        requests.get.return_value = response
+def test_discover(rmock, basic_client):
+    expected_result = [{"url": "http://example.org/feed", "title": "Example", "type": "RSS"}]
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.export()
+    rmock.post(URLS['discover'], json=expected_result)
 
-        requests.get.assert_called_once_with('http://localhost/v1/export',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             timeout=30)
+    result = basic_client.discover("http://example.org/")
 
-        self.assertEqual(result, expected_result)
+    request = _assert_request(rmock, 'POST', URLS['discover'])
 
-    def test_import(self):
-        requests = _get_request_mock()
-        input_data = "my opml data"
+    assert json.loads(request.body) == {"url": "http://example.org/"}
+    assert result == expected_result
 
-        response = mock.Mock()
-        response.status_code = 201
 
-        requests.post.return_value = response
+def test_discover_with_credentials(rmock, basic_client):
+    expected_result = [{"url": "http://example.org/feed", "title": "Example", "type": "RSS"}]
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        client.import_feeds(input_data)
+    rmock.post(URLS['discover'], json=expected_result)
 
-        requests.post.assert_called_once_with('http://localhost/v1/import',
-                                              headers=None,
-                                              data=input_data,
-                                              auth=('username', 'password'),
-                                              timeout=30)
+    result = basic_client.discover("http://example.org/", username="foobar", password="secret", user_agent="Bot")
 
-    def test_import_failure(self):
-        requests = _get_request_mock()
-        input_data = "my opml data"
+    request = _assert_request(rmock, 'POST', URLS['discover'])
 
-        response = mock.Mock()
-        response.status_code = 500
-        response.json.return_value = {"error_message": "random error"}
+    assert json.loads(request.body) == {
+        "url": "http://example.org/",
+        "username": "foobar",
+        "password": "secret",
+        "user_agent": "Bot",
+    }
+    assert result == expected_result
 
-        requests.post.return_value = response
 
-        client = miniflux.Client("http://localhost", "username", "password")
+def test_discover_with_server_error(rmock, basic_client):
+    rmock.post(URLS['discover'], status_code=500)
 
-        with self.assertRaises(ClientError):
-            client.import_feeds(input_data)
+    with pytest.raises(ClientError):
+        basic_client.discover("http://example.org/")
 
-        requests.post.assert_called_once_with('http://localhost/v1/import',
-                                              headers=None,
-                                              data=input_data,
-                                              auth=('username', 'password'),
-                                              timeout=30)
 
-    def test_get_feed(self):
-        requests = _get_request_mock()
-        expected_result = {"id": 123, "title": "Example"}
+def test_export(rmock, basic_client):
+    expected_result = "OPML feed"
 
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = expected_result
+    rmock.get(URLS['export'], text=expected_result)
 
-        requests.get.return_value = response
+    result = basic_client.export()
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.get_feed(123)
+    _assert_request(rmock, 'GET', URLS['export'])
 
-        requests.get.assert_called_once_with('http://localhost/v1/feeds/123',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             timeout=30)
+    assert result == expected_result
 
-        self.assertEqual(result, expected_result)
 
-    def test_create_feed(self):
-        requests = _get_request_mock()
-        expected_result = {"feed_id": 42}
+def test_import(rmock, basic_client):
+    input_data = "my opml data"
 
-        response = mock.Mock()
-        response.status_code = 201
-        response.json.return_value = expected_result
+    rmock.post(URLS['import'], status_code=201, json={})
 
-        requests.post.return_value = response
+    basic_client.import_feeds(input_data)
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.create_feed("http://example.org/feed", 123)
+    request = _assert_request(rmock, 'POST', URLS['import'])
 
-        requests.post.assert_called_once_with('http://localhost/v1/feeds',
-                                              headers=None,
-                                              auth=('username', 'password'),
-                                              data=mock.ANY,
-                                              timeout=30)
+    assert request.body == input_data
 
-        _, kwargs = requests.post.call_args
-        payload = json.loads(kwargs.get('data'))
 
-        self.assertEqual(payload.get('feed_url'), "http://example.org/feed")
-        self.assertEqual(payload.get('category_id'), 123)
-        self.assertIsNone(payload.get('username'))
-        self.assertIsNone(payload.get('password'))
-        self.assertIsNone(payload.get('crawler'))
-        self.assertEqual(result, expected_result['feed_id'])
+def test_import_failure(rmock, basic_client):
+    input_data = "my opml data"
 
-    def test_create_feed_with_credentials(self):
-        requests = _get_request_mock()
-        expected_result = {"feed_id": 42}
+    rmock.post(URLS['import'], status_code=500)
 
-        response = mock.Mock()
-        response.status_code = 201
-        response.json.return_value = expected_result
+    with pytest.raises(ClientError):
+        basic_client.import_feeds(input_data)
 
-        requests.post.return_value = response
+    request = _assert_request(rmock, 'POST', URLS['import'])
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.create_feed("http://example.org/feed", 123, username="foobar", password="secret")
+    assert request.body == input_data
 
-        requests.post.assert_called_once_with('http://localhost/v1/feeds',
-                                              headers=None,
-                                              auth=('username', 'password'),
-                                              data=mock.ANY,
-                                              timeout=30)
 
-        _, kwargs = requests.post.call_args
-        payload = json.loads(kwargs.get('data'))
+def test_get_feed(rmock, basic_client):
+    expected_result = {"id": 123, "title": "Example"}
 
-        self.assertEqual(payload.get('feed_url'), "http://example.org/feed")
-        self.assertEqual(payload.get('category_id'), 123)
-        self.assertEqual(payload.get('username'), "foobar")
-        self.assertEqual(payload.get('password'), "secret")
-        self.assertIsNone(payload.get('crawler'))
-        self.assertEqual(result, expected_result['feed_id'])
+    rmock.get(URLS['feed_123'], json=expected_result)
 
-    def test_create_feed_with_crawler_enabled(self):
-        requests = _get_request_mock()
-        expected_result = {"feed_id": 42}
+    result = basic_client.get_feed(123)
 
-        response = mock.Mock()
-        response.status_code = 201
-        response.json.return_value = expected_result
+    _assert_request(rmock, 'GET', URLS['feed_123'])
 
-        requests.post.return_value = response
+    assert result == expected_result
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.create_feed("http://example.org/feed", 123, crawler=True)
 
-        requests.post.assert_called_once_with('http://localhost/v1/feeds',
-                                              headers=None,
-                                              auth=('username', 'password'),
-                                              data=mock.ANY,
-                                              timeout=30)
+def test_create_feed(rmock, basic_client):
+    expected_result = {"feed_id": 42}
 
-        _, kwargs = requests.post.call_args
-        payload = json.loads(kwargs.get('data'))
+    rmock.post(URLS['feeds'], status_code=201, json=expected_result)
 
-        self.assertEqual(payload.get('feed_url'), "http://example.org/feed")
-        self.assertEqual(payload.get('category_id'), 123)
-        self.assertIsNone(payload.get('username'))
-        self.assertIsNone(payload.get('password'))
-        self.assertTrue(payload.get('crawler'))
-        self.assertEqual(result, expected_result['feed_id'])
+    result = basic_client.create_feed("http://example.org/feed", 123)
 
-    def test_create_feed_with_custom_user_agent_and_crawler_disabled(self):
-        requests = _get_request_mock()
-        expected_result = {"feed_id": 42}
+    request = _assert_request(rmock, 'POST', URLS['feeds'])
 
-        response = mock.Mock()
-        response.status_code = 201
-        response.json.return_value = expected_result
+    assert json.loads(request.body) == BASE_FEED_PAYLOAD
+    assert result == expected_result['feed_id']
 
-        requests.post.return_value = response
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.create_feed("http://example.org/feed", 123, crawler=False, user_agent="GoogleBot")
+def test_create_feed_with_credentials(rmock, basic_client):
+    expected_result = {"feed_id": 42}
 
-        requests.post.assert_called_once_with('http://localhost/v1/feeds',
-                                              headers=None,
-                                              auth=('username', 'password'),
-                                              data=mock.ANY,
-                                              timeout=30)
+    rmock.post(URLS['feeds'], status_code=201, json=expected_result)
 
-        _, kwargs = requests.post.call_args
-        payload = json.loads(kwargs.get('data'))
+    result = basic_client.create_feed("http://example.org/feed", 123, username="foobar", password="secret")
 
-        self.assertEqual(payload.get('feed_url'), "http://example.org/feed")
-        self.assertEqual(payload.get('category_id'), 123)
-        self.assertIsNone(payload.get('username'))
-        self.assertIsNone(payload.get('password'))
-        self.assertFalse(payload.get('crawler'))
-        self.assertEqual(payload.get('user_agent'), "GoogleBot")
-        self.assertEqual(result, expected_result['feed_id'])
+    request = _assert_request(rmock, 'POST', URLS['feeds'])
 
-    def test_update_feed(self):
-        requests = _get_request_mock()
-        expected_result = {"id": 123, "crawler": True, "username": "test"}
+    assert json.loads(request.body) == {**BASE_FEED_PAYLOAD, "username": "foobar", "password": "secret"}
+    assert result == expected_result['feed_id']
 
-        response = mock.Mock()
-        response.status_code = 201
-        response.json.return_value = expected_result
 
-        requests.put.return_value = response
+def test_create_feed_with_crawler_enabled(rmock, basic_client):
+    expected_result = {"feed_id": 42}
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.update_feed(123, crawler=True, username="test")
+    rmock.post(URLS['feeds'], status_code=201, json=expected_result)
 
-        requests.put.assert_called_once_with('http://localhost/v1/feeds/123',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             data=mock.ANY,
-                                             timeout=30)
+    result = basic_client.create_feed("http://example.org/feed", 123, crawler=True)
 
-        _, kwargs = requests.put.call_args
-        payload = json.loads(kwargs.get('data'))
+    request = _assert_request(rmock, 'POST', URLS['feeds'])
 
-        self.assertNotIn('feed_url', payload)
-        self.assertNotIn('category_id', payload)
-        self.assertEqual(payload.get('username'), "test")
-        self.assertTrue(payload.get('crawler'))
-        self.assertEqual(result, expected_result)
+    assert json.loads(request.body) == {**BASE_FEED_PAYLOAD, "crawler": True}
+    assert result == expected_result['feed_id']
 
-    def test_refresh_all_feeds(self):
-        requests = _get_request_mock()
-        expected_result = True
 
-        response = mock.Mock()
-        response.status_code = 201
-        response.json.return_value = expected_result
+def test_create_feed_with_custom_user_agent_and_crawler_disabled(rmock, basic_client):
+    expected_result = {"feed_id": 42}
 
-        requests.put.return_value = response
+    rmock.post(URLS['feeds'], status_code=201, json=expected_result)
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.refresh_all_feeds()
+    result = basic_client.create_feed("http://example.org/feed", 123, crawler=False, user_agent="GoogleBot")
 
-        requests.put.assert_called_once_with('http://localhost/v1/feeds/refresh',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             timeout=30)
+    request = _assert_request(rmock, 'POST', URLS['feeds'])
 
-        assert result == expected_result
+    assert json.loads(request.body) == {**BASE_FEED_PAYLOAD, "crawler": False, "user_agent": "GoogleBot"}
+    assert result == expected_result['feed_id']
 
-    def test_refresh_feed(self):
-        requests = _get_request_mock()
-        expected_result = True
 
-        response = mock.Mock()
-        response.status_code = 201
-        response.json.return_value = expected_result
+def test_update_feed(rmock, basic_client):
+    expected_result = {"id": 123, "crawler": True, "username": "test"}
 
-        requests.put.return_value = response
+    rmock.put(URLS['feed_123'], status_code=201, json=expected_result)
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.refresh_feed(123)
+    result = basic_client.update_feed(123, crawler=True, username="test")
 
-        requests.put.assert_called_once_with('http://localhost/v1/feeds/123/refresh',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             timeout=30)
+    request = _assert_request(rmock, 'PUT', URLS['feed_123'])
 
-        assert result == expected_result
+    assert json.loads(request.body) == {"crawler": True, "username": "test"}
+    assert result == expected_result
 
-    def test_get_feed_entries(self):
-        requests = _get_request_mock()
-        expected_result = []
 
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = expected_result
+def test_refresh_all_feeds(rmock, basic_client):
+    expected_result = True
 
-        requests.get.return_value = response
+    rmock.put(URLS['feeds_refresh'], status_code=201)
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.get_feed_entries(123)
+    result = basic_client.refresh_all_feeds()
 
-        requests.get.assert_called_once_with('http://localhost/v1/feeds/123/entries',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             params=None,
-                                             timeout=30)
+    _assert_request(rmock, 'PUT', URLS['feeds_refresh'])
 
-        assert result == expected_result
+    assert result == expected_result
 
-    def test_get_feed_entries_with_direction_param(self):
-        requests = _get_request_mock()
-        expected_result = []
 
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = expected_result
+def test_refresh_feed(rmock, basic_client):
+    expected_result = True
 
-        requests.get.return_value = response
+    rmock.put(URLS['feed_123_refresh'], status_code=201)
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.get_feed_entries(123, direction='asc')
+    result = basic_client.refresh_feed(123)
 
-        requests.get.assert_called_once_with('http://localhost/v1/feeds/123/entries',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             params={'direction': 'asc'},
-                                             timeout=30)
+    _assert_request(rmock, 'PUT', URLS['feed_123_refresh'])
 
-        assert result == expected_result
+    assert result == expected_result
 
-    def test_mark_feed_as_read(self):
-        requests = _get_request_mock()
 
-        response = mock.Mock()
-        response.status_code = 204
+def test_get_feed_entries(rmock, basic_client):
+    expected_result = []
 
-        requests.put.return_value = response
+    rmock.get(URLS['feed_123_entries'], json=expected_result)
 
-        client = miniflux.Client("http://localhost", api_key="secret")
-        client.mark_feed_entries_as_read(123)
+    result = basic_client.get_feed_entries(123)
 
-        requests.put.assert_called_once_with('http://localhost/v1/feeds/123/mark-all-as-read',
-                                             headers={'X-Auth-Token': 'secret'},
-                                             auth=None,
-                                             timeout=30)
+    _assert_request(rmock, 'GET', URLS['feed_123_entries'])
 
-    def test_mark_category_entries_as_read(self):
-        requests = _get_request_mock()
+    assert result == expected_result
 
-        response = mock.Mock()
-        response.status_code = 204
 
-        requests.put.return_value = response
+def test_get_feed_entries_with_direction_param(rmock, basic_client):
+    expected_result = []
 
-        client = miniflux.Client("http://localhost", api_key="secret")
-        client.mark_category_entries_as_read(123)
+    rmock.get(URLS['feed_123_entries'], json=expected_result)
 
-        requests.put.assert_called_once_with('http://localhost/v1/categories/123/mark-all-as-read',
-                                             headers={'X-Auth-Token': 'secret'},
-                                             auth=None,
-                                             timeout=30)
+    result = basic_client.get_feed_entries(123, direction='asc')
 
-    def test_mark_user_entries_as_read(self):
-        requests = _get_request_mock()
+    _assert_request(rmock, 'GET', URLS['feed_123_entries'] + '?direction=asc')
 
-        response = mock.Mock()
-        response.status_code = 204
+    assert result == expected_result
 
-        requests.put.return_value = response
 
-        client = miniflux.Client("http://localhost", api_key="secret")
-        client.mark_user_entries_as_read(123)
+@pytest.mark.parametrize('method,url', [
+    ('mark_feed_entries_as_read', URLS['feed_123_mark_all_as_read']),
+    ('mark_category_entries_as_read', URLS['category_123_mark_all_as_read']),
+    ('mark_user_entries_as_read', URLS['user_123_mark_all_as_read']),
+])
+def test_mark_entries_as_read(rmock, api_key_client, method, url):
+    rmock.put(url, status_code=204)
 
-        requests.put.assert_called_once_with('http://localhost/v1/users/123/mark-all-as-read',
-                                             headers={'X-Auth-Token': 'secret'},
-                                             auth=None,
-                                             timeout=30)
+    getattr(api_key_client, method)(123)
 
-    def test_get_entry(self):
-        requests = _get_request_mock()
-        expected_result = []
+    _assert_request(rmock, 'PUT', url, headers=TOKEN_HEADERS)
 
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = expected_result
 
-        requests.get.return_value = response
+def test_get_entry(rmock, basic_client):
+    expected_result = []
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.get_entry(123)
+    rmock.get(URLS['entry_123'], json=expected_result)
 
-        requests.get.assert_called_once_with('http://localhost/v1/entries/123',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             timeout=30)
+    result = basic_client.get_entry(123)
 
-        assert result == expected_result
+    _assert_request(rmock, 'GET', URLS['entry_123'])
 
-    def test_get_entries(self):
-        requests = _get_request_mock()
-        expected_result = []
+    assert result == expected_result
 
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = expected_result
 
-        requests.get.return_value = response
+def test_get_entries(rmock, basic_client):
+    expected_result = []
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.get_entries(status='unread', limit=10, offset=5)
+    rmock.get(URLS['entries'], json=expected_result)
 
-        requests.get.assert_called_once_with('http://localhost/v1/entries',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             params=mock.ANY,
-                                             timeout=30)
+    result = basic_client.get_entries(status='unread', limit=10, offset=5)
 
-        assert result == expected_result
+    _assert_request(rmock, 'GET', URLS['entries'] + '?status=unread&limit=10&offset=5')
 
-    def test_get_entries_with_before_param(self):
-        param_value = int(time.time())
-        requests = _get_request_mock()
-        expected_result = []
+    assert result == expected_result
 
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = expected_result
 
-        requests.get.return_value = response
+@pytest.mark.parametrize('kwargs,expected_query', [
+    ({'before': BEFORE_TS}, f'before={BEFORE_TS}'),
+    ({'starred': True}, 'starred=True'),
+    ({'starred': False, 'after_entry_id': 123}, 'after_entry_id=123'),
+])
+def test_get_entries_with_params(rmock, basic_client, kwargs, expected_query):
+    expected_result = []
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.get_entries(before=param_value)
+    rmock.get(URLS['entries'], json=expected_result)
 
-        requests.get.assert_called_once_with('http://localhost/v1/entries',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             params={'before': param_value},
-                                             timeout=30)
+    result = basic_client.get_entries(**kwargs)
 
-        assert result == expected_result
+    _assert_request(rmock, 'GET', f"{URLS['entries']}?{expected_query}")
 
-    def test_get_entries_with_starred_param(self):
-        requests = _get_request_mock()
-        expected_result = []
+    assert result == expected_result
 
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = expected_result
 
-        requests.get.return_value = response
+def test_get_user_by_id(rmock, basic_client):
+    expected_result = []
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.get_entries(starred=True)
+    rmock.get(URLS['user_123'], json=expected_result)
 
-        requests.get.assert_called_once_with('http://localhost/v1/entries',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             params={'starred': True},
-                                             timeout=30)
+    result = basic_client.get_user_by_id(123)
 
-        assert result == expected_result
+    _assert_request(rmock, 'GET', URLS['user_123'])
 
-    def test_get_entries_with_starred_param_at_false(self):
-        requests = _get_request_mock()
-        expected_result = []
+    assert result == expected_result
 
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = expected_result
 
-        requests.get.return_value = response
+def test_get_user_by_username(rmock, basic_client):
+    expected_result = []
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.get_entries(starred=False, after_entry_id=123)
+    rmock.get(URLS['user_foobar'], json=expected_result)
 
-        requests.get.assert_called_once_with('http://localhost/v1/entries',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             params={'after_entry_id': 123},
-                                             timeout=30)
+    result = basic_client.get_user_by_username("foobar")
 
-        assert result == expected_result
+    _assert_request(rmock, 'GET', URLS['user_foobar'])
 
-    def test_get_user_by_id(self):
-        requests = _get_request_mock()
-        expected_result = []
+    assert result == expected_result
 
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = expected_result
 
-        requests.get.return_value = response
+def test_update_user(rmock, basic_client):
+    expected_result = {"id": 123, "theme": "Black", "language": "fr_FR"}
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.get_user_by_id(123)
+    rmock.put(URLS['user_123'], status_code=201, json=expected_result)
 
-        requests.get.assert_called_once_with('http://localhost/v1/users/123',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             timeout=30)
+    result = basic_client.update_user(123, theme="black", language="fr_FR")
 
-        assert result == expected_result
+    request = _assert_request(rmock, 'PUT', URLS['user_123'])
 
-    def test_get_user_by_username(self):
-        requests = _get_request_mock()
-        expected_result = []
+    assert json.loads(request.body) == {"theme": "black", "language": "fr_FR"}
+    assert result == expected_result
 
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = expected_result
 
-        requests.get.return_value = response
+def test_timeout(rmock):
+    rmock.get(URLS['export'], exc=Timeout)
 
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.get_user_by_username("foobar")
-
-        requests.get.assert_called_once_with('http://localhost/v1/users/foobar',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             timeout=30)
-
-        assert result == expected_result
-
-    def test_update_user(self):
-        requests = _get_request_mock()
-        expected_result = {"id": 123, "theme": "Black", "language": "fr_FR"}
-
-        response = mock.Mock()
-        response.status_code = 201
-        response.json.return_value = expected_result
-
-        requests.put.return_value = response
-
-        client = miniflux.Client("http://localhost", "username", "password")
-        result = client.update_user(123, theme="black", language="fr_FR")
-
-        requests.put.assert_called_once_with('http://localhost/v1/users/123',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             data=mock.ANY,
-                                             timeout=30)
-
-        _, kwargs = requests.put.call_args
-        payload = json.loads(kwargs.get('data'))
-
-        self.assertNotIn('username', payload)
-        self.assertNotIn('password', payload)
-        self.assertEqual(payload.get("theme"), "black")
-        self.assertEqual(payload.get("language"), "fr_FR")
-        self.assertEqual(result, expected_result)
-
-    def test_timeout(self):
-        requests = _get_request_mock()
-        requests.get.side_effect = Timeout()
-
-        client = miniflux.Client("http://localhost", "username", "password", 1.0)
-        with self.assertRaises(Timeout):
-            client.export()
-
-        requests.get.assert_called_once_with('http://localhost/v1/export',
-                                             headers=None,
-                                             auth=('username', 'password'),
-                                             timeout=1.0)
-
-    def test_api_key_auth(self):
-        requests = _get_request_mock()
-
-        response = mock.Mock()
-        response.status_code = 200
-        response.json.return_value = {}
+    client = miniflux.Client(BASE, *AUTH, 1.0)
+    with pytest.raises(Timeout):
+        client.export()
 
-        requests.get.return_value = response
+    assert rmock.last_request.timeout == 1.0
 
-        client = miniflux.Client("http://localhost", api_key="secret")
-        client.export()
 
-        requests.get.assert_called_once_with('http://localhost/v1/export',
-                                             headers={'X-Auth-Token': 'secret'},
-                                             auth=None,
-                                             timeout=30.0)
+def test_api_key_auth(rmock, api_key_client):
+    rmock.get(URLS['export'], text="OPML feed")
 
+    api_key_client.export()
 
-def _get_request_mock():
-    patcher = mock.patch('miniflux.requests')
-    return patcher.start()
+    _assert_request(rmock, 'GET', URLS['export'], headers=TOKEN_HEADERS)